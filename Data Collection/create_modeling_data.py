@@ -2,6 +2,7 @@ import pandas as pd
 import os
 from datetime import datetime
 import numpy as np
+from starter_pitcher_stats import add_starter_stats
 
 def create_modeling_dataset():
     """
@@ -16,6 +17,7 @@ def create_modeling_dataset():
     SCHEDULE_PATH = os.path.join(RAW_DATA_DIR, 'schedule_data.csv')
     HITTING_STATS_PATH = os.path.join(PROCESSED_DATA_DIR, 'team_hitting_stats.csv')
     PITCHING_STATS_PATH = os.path.join(PROCESSED_DATA_DIR, 'team_pitching_stats.csv')
+    RAW_PITCHING_PATH = os.path.join(RAW_DATA_DIR, 'pitching_data.csv')
     ODDS_PATH = os.path.join(PROCESSED_DATA_DIR, 'mlb_odds_2022_present.csv')
 
     # Create output directory if it doesn't exist
@@ -56,6 +58,11 @@ def create_modeling_dataset():
 
     hitting_df = pd.read_csv(HITTING_STATS_PATH)
     pitching_df = pd.read_csv(PITCHING_STATS_PATH)
+    try:
+        raw_pitching_df = pd.read_csv(RAW_PITCHING_PATH)
+    except FileNotFoundError:
+        print(f"Error: Player pitching file not found at {RAW_PITCHING_PATH}. Run get_raw_data.py first.")
+        return
     odds_df = pd.read_csv(ODDS_PATH)
 
     # Prepare schedule data (The source of truth for home/away teams)
@@ -88,14 +95,19 @@ def create_modeling_dataset():
     print(f"Found {len(testing_schedule)} upcoming games for today's testing set.")
 
     # --- 3. Define a Reusable Merging Function ---
-    def merge_game_data(df, hitting_stats, pitching_stats, odds_data):
+    def merge_game_data(df, hitting_stats, pitching_stats, raw_pitching, odds_data):
         if df.empty:
             return pd.DataFrame()
             
         base_cols = ['game_id', 'game_date', 'year', 'home_team', 'away_team', 'home_team_won']
-        games = df[base_cols].copy()
+        starter_cols = ['home_probable_pitcher', 'away_probable_pitcher']
+        games = df[base_cols + starter_cols].copy()
         games.dropna(subset=['home_team', 'away_team'], inplace=True)
 
+        # Attach probable-starter stats, falling back to team aggregates when a starter is unknown
+        games = add_starter_stats(games, raw_pitching, pitching_stats)
+        games.drop(columns=starter_cols, inplace=True)
+
         # <<< FIX: Create the same temporary merge key on the schedule data >>>
         # This key is order-independent and does NOT change the original home/away columns.
         games['merge_key'] = games.apply(lambda row: '_'.join(sorted([row['home_team'], row['away_team']])) + '_' + row['game_date'].strftime('%Y-%m-%d'), axis=1)
@@ -124,7 +136,7 @@ def create_modeling_dataset():
             continue
         
         print(f"\nProcessing {data_type} data...")
-        final_data = merge_game_data(schedule_data, hitting_df, pitching_df, odds_df)
+        final_data = merge_game_data(schedule_data, hitting_df, pitching_df, raw_pitching_df, odds_df)
         
         if not final_data.empty:
             if data_type == 'training':
@@ -0,0 +1,243 @@
+import json
+import random
+import threading
+import time
+import argparse
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Display names as they appear on Sportsbook Review (the Athletics quirk included).
+TEAM_DISPLAY_NAMES = [
+    'Baltimore', 'Toronto', 'Arizona', 'Detroit', 'Boston', 'Minnesota', 'Washington', 'Houston',
+    'Atlanta', 'Kansas City', 'Chi. Cubs', 'Milwaukee', 'Philadelphia', 'Chi. White Sox', 'Pittsburgh',
+    'San Francisco', 'NY Mets', 'San Diego', 'Colorado', 'Cleveland', 'Tampa Bay', 'NY Yankees',
+    'LA Dodgers', 'Cincinnati', 'Miami', 'St. Louis', 'Texas', 'LA Angels', 'Seattle', 'Athletics Athletics'
+]
+ODDS_PATH = '/betting-odds/mlb-baseball/'
+
+def _date_rng(date_str, seed):
+    """A random generator that is deterministic per (date, seed), so every request for a date sees the same slate."""
+    return random.Random(f"{seed}-{date_str}")
+
+def games_for_date(date_str, games_per_day=15):
+    """
+    Returns how many games the fake server lists for a date. Dates outside
+    March-November are off-season and have none.
+    """
+    if datetime.strptime(date_str, '%Y-%m-%d').month not in range(3, 12):
+        return 0
+    return games_per_day
+
+def _american_odds(rng):
+    """Draws a realistic opening moneyline pair for one game."""
+    favorite = -rng.randint(105, 250)
+    # American odds have no lines between -100 and +100, so a near pick'em underdog sits at +100.
+    underdog = max(100, abs(favorite) - rng.randint(10, 25))
+    return (favorite, underdog) if rng.random() < 0.55 else (underdog, favorite)
+
+def build_next_data(date_str, games_per_day=15, seed=0):
+    """
+    Builds the __NEXT_DATA__ payload for a date in the shape scrape_odds_for_date expects.
+    Games are split across two odds tables, as on the real site.
+    """
+    rng = _date_rng(date_str, seed)
+    teams = TEAM_DISPLAY_NAMES[:]
+    day_start = datetime.strptime(date_str, '%Y-%m-%d') + timedelta(hours=16)
+
+    game_rows = []
+    slate_size = len(teams) // 2
+    for i in range(games_for_date(date_str, games_per_day)):
+        # Re-pair the league every full slate so large game counts read like doubleheader-heavy days.
+        if i % slate_size == 0:
+            rng.shuffle(teams)
+        pair = i % slate_size
+        home_odds, away_odds = _american_odds(rng)
+        home_pick = round(rng.uniform(20, 80), 2)
+        start = day_start + timedelta(minutes=30 * rng.randint(0, 12))
+        game_rows.append({
+            'gameView': {
+                'startDate': start.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                'homeTeam': {'displayName': teams[2 * pair]},
+                'awayTeam': {'displayName': teams[2 * pair + 1]},
+                'consensus': {
+                    'homeMoneyLinePickPercent': home_pick,
+                    'awayMoneyLinePickPercent': round(100 - home_pick, 2),
+                } if rng.random() < 0.9 else None,
+            },
+            'openingLineViews': [{'openingLine': {'homeOdds': home_odds, 'awayOdds': away_odds}}],
+        })
+
+    half = len(game_rows) // 2
+    odds_tables = [{'oddsTableModel': {'gameRows': rows}} for rows in (game_rows[:half], game_rows[half:]) if rows]
+    return {'props': {'pageProps': {'oddsTables': odds_tables}}}
+
+def render_page(payload):
+    """Wraps a payload in the minimal HTML the scraper parses."""
+    return (
+        '<html><head><title>MLB Odds</title></head><body><div id="__next"></div>'
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(payload)}</script>'
+        '</body></html>'
+    )
+
+class FaultConfig:
+    """
+    Fault injection settings for the fake server.
+
+    Args:
+        latency (float): Base response delay in seconds.
+        jitter (float): Extra uniformly-distributed delay in seconds, added to `latency`.
+        error_rate (float): Fraction of requests answered with HTTP 500.
+        malformed_rate (float): Fraction of requests answered with a broken __NEXT_DATA__ payload.
+        rate_limit (float): Sustained requests per second allowed before answering HTTP 429. 0 disables throttling.
+        burst (int): Token-bucket size for `rate_limit`.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.05, error_rate=0.0, malformed_rate=0.0, rate_limit=0.0, burst=10):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.rate_limit = rate_limit
+        self.burst = burst
+
+class _TokenBucket:
+    """Thread-safe token bucket used to emulate the site's 429 throttling."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+class FakeSportsbookServer(ThreadingHTTPServer):
+    """
+    A local stand-in for Sportsbook Review's MLB odds pages.
+
+    Serves GET /betting-odds/mlb-baseball/?date=YYYY-MM-DD with a generated slate
+    of `games_per_day` games and applies the faults in `faults`. Request outcomes are
+    tallied in `stats` ('ok', 'error', 'malformed', 'throttled', 'not_found').
+    """
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, games_per_day=15, seed=0, faults=None):
+        super().__init__((host, port), _FakeSportsbookHandler)
+        self.games_per_day = games_per_day
+        self.seed = seed
+        self.faults = faults or FaultConfig()
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_stats(self):
+        """Clears request counters and refills the throttling bucket, e.g. between load-test runs."""
+        self.stats = {'ok': 0, 'error': 0, 'malformed': 0, 'throttled': 0, 'not_found': 0}
+        self.stats_lock = threading.Lock()
+        self.bucket = _TokenBucket(self.faults.rate_limit, self.faults.burst) if self.faults.rate_limit else None
+
+    def record(self, outcome):
+        with self.stats_lock:
+            self.stats[outcome] += 1
+
+    def roll(self):
+        """A uniform draw shared across handler threads."""
+        with self.rng_lock:
+            return self.rng.random()
+
+    def start_in_thread(self):
+        """Serves requests from a daemon thread and returns it. Call shutdown() to stop."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+class _FakeSportsbookHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        faults = server.faults
+        parsed = urlparse(self.path)
+        date_str = parse_qs(parsed.query).get('date', [''])[0]
+
+        try:
+            datetime.strptime(date_str, '%Y-%m-%d')
+            valid_date = parsed.path == ODDS_PATH
+        except ValueError:
+            valid_date = False
+        if not valid_date:
+            server.record('not_found')
+            return self._send(404, 'Not Found')
+
+        if server.bucket and not server.bucket.take():
+            server.record('throttled')
+            return self._send(429, 'Too Many Requests', headers={'Retry-After': '1'})
+
+        time.sleep(faults.latency + faults.jitter * server.roll())
+
+        if server.roll() < faults.error_rate:
+            server.record('error')
+            return self._send(500, 'Internal Server Error')
+
+        payload = build_next_data(date_str, server.games_per_day, server.seed)
+        if server.roll() < faults.malformed_rate:
+            server.record('malformed')
+            # Alternate between the two breakages seen in practice: truncated JSON and a missing key.
+            if server.roll() < 0.5:
+                body = render_page(payload).replace('}}}</script>', '</script>')
+            else:
+                body = render_page({'props': {'pageProps': {}}})
+            return self._send(200, body)
+
+        server.record('ok')
+        self._send(200, render_page(payload))
+
+    def _send(self, status, body, headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass # Keep the console quiet under load
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve fake Sportsbook Review MLB odds pages locally.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--games-per-day', type=int, default=15)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--jitter', type=float, default=0.05)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--malformed-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0)
+    parser.add_argument('--burst', type=int, default=10)
+    args = parser.parse_args()
+
+    faults = FaultConfig(args.latency, args.jitter, args.error_rate, args.malformed_rate, args.rate_limit, args.burst)
+    server = FakeSportsbookServer(port=args.port, games_per_day=args.games_per_day, faults=faults)
+    print(f"Serving fake odds pages at {server.base_url}{ODDS_PATH}?date=YYYY-MM-DD")
+    print(f"Point the scraper at it with: SBR_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+        server.server_close()
@@ -9,17 +9,21 @@ import concurrent.futures
 from tqdm import tqdm
 import numpy as np
 
-def scrape_odds_for_date(target_date_str: str):
+# Overridable so the scraper can be pointed at a local stand-in (see fake_sportsbook_server.py).
+BASE_URL = os.environ.get('SBR_BASE_URL', 'https://www.sportsbookreview.com')
+
+def scrape_odds_for_date(target_date_str: str, base_url: str = BASE_URL):
     """
     Scrapes MLB moneyline odds from Sportsbook Review for a specific date.
     
     Args:
         target_date_str: The date to scrape in 'YYYY-MM-DD' format.
+        base_url: Scheme and host of the odds site. Defaults to BASE_URL.
         
     Returns:
         A pandas DataFrame with the odds data for that day, or None if no games are found.
     """
-    url = f"https://www.sportsbookreview.com/betting-odds/mlb-baseball/?date={target_date_str}"
+    url = f"{base_url.rstrip('/')}/betting-odds/mlb-baseball/?date={target_date_str}"
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
@@ -99,14 +103,15 @@ def scrape_odds_for_date(target_date_str: str):
 
     except requests.exceptions.RequestException:
         return None
-    except (KeyError, IndexError, TypeError):
+    except (KeyError, IndexError, TypeError, ValueError):
+        # ValueError covers truncated or otherwise undecodable __NEXT_DATA__ JSON
         return None
 
 if __name__ == "__main__":
     START_YEAR = 2022
     OUTPUT_DIR = "processed_data"
     OUTPUT_FILENAME = "mlb_odds_2022_present.csv"
-    MAX_WORKERS = 6
+    MAX_WORKERS = int(os.environ.get('SBR_MAX_WORKERS', 6)) # Tune with odds_load_test.py
     
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     output_path = os.path.join(OUTPUT_DIR, OUTPUT_FILENAME)
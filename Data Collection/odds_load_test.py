@@ -0,0 +1,97 @@
+import argparse
+import concurrent.futures
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from odds_data import scrape_odds_for_date
+from fake_sportsbook_server import FakeSportsbookServer, FaultConfig, games_for_date
+
+def _timed_scrape(date_str, base_url):
+    """Scrapes one date and returns (date, latency in seconds, games returned)."""
+    start = time.perf_counter()
+    df = scrape_odds_for_date(date_str, base_url=base_url)
+    return date_str, time.perf_counter() - start, 0 if df is None else len(df)
+
+def run_load_level(server, dates, workers):
+    """
+    Scrapes `dates` against `server` with `workers` threads, the same way odds_data.py does.
+
+    Returns:
+        dict: Throughput, latency percentiles over successful requests, failed dates,
+              completeness and server-side outcome counts.
+    """
+    server.reset_stats()
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_timed_scrape, dates, [server.base_url] * len(dates)))
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([latency for _, latency, _ in results])
+    scraped = np.array([games for _, _, games in results])
+    expected = np.array([games_for_date(date_str, server.games_per_day) for date_str, _, _ in results])
+
+    # Instant 429/500 responses would drag the percentiles down exactly where throttling hurts,
+    # so latency is measured only over requests that returned data.
+    in_season = expected > 0
+    succeeded = scraped > 0
+    ok_latencies = latencies[succeeded] * 1000 if succeeded.any() else np.array([np.nan])
+    return {
+        'workers': workers,
+        'dates_per_sec': len(dates) / elapsed,
+        'p50_ms': np.percentile(ok_latencies, 50),
+        'p95_ms': np.percentile(ok_latencies, 95),
+        'p99_ms': np.percentile(ok_latencies, 99),
+        'max_ms': ok_latencies.max(),
+        'failed_dates': int((in_season & ~succeeded).sum()),
+        # Share of expected games actually returned, and share of game days that came back complete.
+        'game_completeness': scraped.sum() / max(expected.sum(), 1),
+        'dates_complete': (scraped[in_season] == expected[in_season]).mean() if in_season.any() else 1.0,
+        **{f'srv_{outcome}': count for outcome, count in server.stats.items() if outcome != 'not_found'},
+    }
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the odds scraper against a local fake sportsbook.")
+    parser.add_argument('--start', default='2024-03-01', help="First date to scrape (YYYY-MM-DD).")
+    parser.add_argument('--days', type=int, default=120, help="Number of consecutive dates to scrape.")
+    parser.add_argument('--workers', default='1,2,4,6,8,12,16', help="Comma-separated concurrency levels to test.")
+    parser.add_argument('--games-per-day', type=int, default=15)
+    parser.add_argument('--latency', type=float, default=0.15, help="Base server latency in seconds.")
+    parser.add_argument('--jitter', type=float, default=0.15, help="Extra random latency in seconds.")
+    parser.add_argument('--error-rate', type=float, default=0.02)
+    parser.add_argument('--malformed-rate', type=float, default=0.01)
+    parser.add_argument('--rate-limit', type=float, default=20.0, help="Requests/sec before HTTP 429 (0 disables).")
+    parser.add_argument('--burst', type=int, default=10)
+    args = parser.parse_args()
+
+    faults = FaultConfig(args.latency, args.jitter, args.error_rate, args.malformed_rate, args.rate_limit, args.burst)
+    server = FakeSportsbookServer(games_per_day=args.games_per_day, faults=faults)
+    server.start_in_thread()
+
+    dates = [d.strftime('%Y-%m-%d') for d in pd.date_range(date.fromisoformat(args.start), periods=args.days)]
+    levels = [int(w) for w in args.workers.split(',')]
+
+    print(f"--- Odds Scraper Load Test against {server.base_url} ---")
+    print(f"{len(dates)} dates, {args.games_per_day} games/day, latency {args.latency}s + up to {args.jitter}s, "
+          f"errors {args.error_rate:.0%}, malformed {args.malformed_rate:.0%}, rate limit {args.rate_limit or 'off'}/s")
+
+    rows = []
+    for workers in levels:
+        print(f"  Running with {workers} worker(s)...")
+        rows.append(run_load_level(server, dates, workers))
+    server.shutdown()
+    server.server_close()
+
+    report = pd.DataFrame(rows)
+    print("\n--- Results ---")
+    print(report.to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+
+    # Recommend the smallest worker count within 5% of the best throughput that loses no extra data.
+    best_completeness = report['game_completeness'].max()
+    candidates = report[report['game_completeness'] >= best_completeness - 0.005]
+    candidates = candidates[candidates['dates_per_sec'] >= 0.95 * candidates['dates_per_sec'].max()]
+    recommended = int(candidates['workers'].min())
+    print(f"\n✅ Suggested MAX_WORKERS: {recommended} (set SBR_MAX_WORKERS={recommended} for odds_data.py)")
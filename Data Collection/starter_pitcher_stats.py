@@ -0,0 +1,123 @@
+import pandas as pd
+import numpy as np
+
+# Per-pitcher stats attached to each game's probable starters. Column names follow the
+# merged dataset's STAT_TEAM_CATEGORY layout, e.g. 'FIP_home_starter'.
+STARTER_STATS = ['FIP', 'xFIP', 'K-BB%']
+STARTER_WEIGHT_COL = 'TBF'
+
+# Generational suffixes that appear inconsistently between the schedule and FanGraphs.
+# Only a trailing token is stripped, so a middle initial like 'Luis V. Garcia' survives.
+NAME_SUFFIX_PATTERN = r"\s(?:jr|sr|ii|iii|iv|v)$"
+
+def normalize_player_names(names):
+    """
+    Normalizes a Series of player names so 'José Ramírez', 'Jose Ramirez' and
+    'Daniel Lynch IV' / 'Daniel Lynch' hash to the same key.
+    """
+    unique_names = pd.Series(names.dropna().unique(), dtype='object')
+    normalized = (
+        unique_names.str.normalize('NFKD')
+        .str.encode('ascii', errors='ignore').str.decode('ascii')
+        .str.lower()
+        .str.replace(r"[^a-z\s]", '', regex=True)
+        .str.split().str.join(' ')
+        .str.replace(NAME_SUFFIX_PATTERN, '', regex=True)
+    )
+    # Normalize each distinct name once, then map back onto the full column.
+    return names.map(dict(zip(unique_names, normalized)))
+
+def build_pitcher_index(raw_pitching_df):
+    """
+    Builds hashed lookups from player-season rows to STARTER_STATS.
+
+    Returns:
+        tuple: (team_level, season_level) DataFrames indexed by 'year|team|name' and
+               'year|name' keys. Rows are combined per FanGraphs player (IDfg), so a traded
+               pitcher's team rows become one TBF-weighted line. Names shared by different
+               players are left out, since the schedule gives no way to tell them apart.
+    """
+    df = raw_pitching_df.copy()
+    if 'Season' in df.columns:
+        df.rename(columns={'Season': 'year'}, inplace=True)
+    for col in STARTER_STATS + [STARTER_WEIGHT_COL]:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df.dropna(subset=STARTER_STATS + ['IDfg'], inplace=True)
+
+    df['name_key'] = normalize_player_names(df['Name'])
+    df['year'] = df['year'].astype(str)
+    df['weight'] = df[STARTER_WEIGHT_COL].fillna(0).clip(lower=1)
+
+    def weighted_by_player(keys):
+        """TBF-weighted STARTER_STATS per (keys + IDfg), dropping keys that map to several players."""
+        weighted = df[STARTER_STATS].multiply(df['weight'], axis=0)
+        weighted[keys + ['IDfg']] = df[keys + ['IDfg']]
+        weighted['weight'] = df['weight']
+        sums = weighted.groupby(keys + ['IDfg']).sum()
+        table = sums[STARTER_STATS].divide(sums['weight'], axis=0).reset_index('IDfg')
+        ambiguous = table.index.duplicated(keep=False)
+        table = table[~ambiguous].drop(columns='IDfg')
+        table.index = table.index.map('|'.join)
+        return table, ambiguous.sum()
+
+    team_level, _ = weighted_by_player(['year', 'Team', 'name_key'])
+    season_level, ambiguous = weighted_by_player(['year', 'name_key'])
+    if ambiguous:
+        print(f"   Skipping {ambiguous} player-seasons whose names are shared by another pitcher that year.")
+
+    return team_level, season_level
+
+def _lookup(table, keys):
+    """Resolves an array of keys against a keyed table in one hashed pass. Misses are NaN."""
+    positions = table.index.get_indexer(keys)
+    values = table.to_numpy(dtype=float)[positions]
+    values[positions == -1] = np.nan
+    return values
+
+def add_starter_stats(games, raw_pitching_df, team_pitching_df):
+    """
+    Adds STARTER_STATS for both probable starters of every game.
+
+    Each starter is matched on (year, team, name) first, then on (year, name) to catch
+    traded pitchers, and finally falls back to the team's season pitching aggregate.
+    Names shared by several pitchers are never matched.
+
+    Args:
+        games (pd.DataFrame): Game rows with 'year', 'home_team', 'away_team',
+                              'home_probable_pitcher' and 'away_probable_pitcher'.
+        raw_pitching_df (pd.DataFrame): Player-season rows from raw_data/pitching_data.csv.
+        team_pitching_df (pd.DataFrame): Team-season aggregates from processed_data/team_pitching_stats.csv.
+
+    Returns:
+        pd.DataFrame: `games` with '{stat}_home_starter' and '{stat}_away_starter' columns added.
+    """
+    print("\n--- Resolving Probable Starters ---")
+    team_level, season_level = build_pitcher_index(raw_pitching_df)
+
+    team_fallback = team_pitching_df.copy()
+    team_fallback.index = team_fallback['year'].astype(str) + '|' + team_fallback['Team']
+    team_fallback = team_fallback[STARTER_STATS]
+
+    years = games['year'].astype(str)
+    for team_type in ['home', 'away']:
+        names = normalize_player_names(games[f'{team_type}_probable_pitcher'])
+        teams = games[f'{team_type}_team']
+
+        values = _lookup(team_level, (years + '|' + teams + '|' + names).to_numpy())
+        matched = ~np.isnan(values).any(axis=1)
+
+        retry = ~matched
+        values[retry] = _lookup(season_level, (years + '|' + names)[retry].to_numpy())
+        matched = ~np.isnan(values).any(axis=1)
+
+        fallback = ~matched
+        values[fallback] = _lookup(team_fallback, (years + '|' + teams)[fallback].to_numpy())
+
+        for j, stat in enumerate(STARTER_STATS):
+            games[f'{stat}_{team_type}_starter'] = values[:, j]
+
+        match_rate = matched.mean() if len(games) else 0.0
+        print(f"   {team_type.capitalize()} starters matched: {matched.sum()}/{len(games)} ({match_rate:.1%}), "
+              f"{fallback.sum()} fell back to team aggregates.")
+
+    return games
@@ -0,0 +1,217 @@
+import ast
+import hashlib
+import json
+import os
+import numpy as np
+
+# --- Configuration ---
+FEATURE_CACHE_DIR = os.path.join('modeling_data', 'feature_cache')
+# Most recently used matrices kept on disk (e.g. the training set plus a few daily slates).
+FEATURE_CACHE_MAX_ENTRIES = 8
+
+# Base stats exactly as they appear in the merged modeling datasets, e.g. 'wOBA_home_hitting'.
+# These must stay in sync with the stats kept by aggregate_player_data.py.
+HITTING_STATS = ['HR', 'PA', 'wOBA', 'K%', 'BB%', 'Barrel%', 'HardHit%']
+PITCHING_STATS = ['HR', 'TBF', 'FIP', 'xFIP', 'K/9', 'BB/9', 'K-BB%', 'HR/9', 'Barrel%', 'HardHit%']
+# Probable-starter stats attached by starter_pitcher_stats.py, e.g. 'FIP_home_starter'.
+STARTER_STATS = ['FIP', 'xFIP', 'K-BB%']
+CATEGORY_PREFIXES = {'hitting': 'off_', 'pitching': 'pch_', 'starter': 'sp_'}
+
+# Derived features, declared as expressions over base features (or other derived features).
+# To add a feature, add a line here -- dependencies are resolved automatically.
+DERIVED_FEATURES = {
+    'off_wOBA_diff': 'off_wOBA_home - off_wOBA_away',
+    'off_K_Pct_diff': 'off_K_Pct_home - off_K_Pct_away',
+    'off_BB_Pct_diff': 'off_BB_Pct_home - off_BB_Pct_away',
+    'off_Barrel_Pct_diff': 'off_Barrel_Pct_home - off_Barrel_Pct_away',
+    'pch_FIP_diff': 'pch_FIP_home - pch_FIP_away',
+    'pch_K_BB_Pct_diff': 'pch_K_BB_Pct_home - pch_K_BB_Pct_away',
+    'pch_Barrel_Pct_diff': 'pch_Barrel_Pct_home - pch_Barrel_Pct_away',
+    'matchup_woba_fip_home': 'off_wOBA_home - pch_FIP_away',
+    'matchup_woba_fip_away': 'off_wOBA_away - pch_FIP_home',
+}
+
+# Features over probable-starter stats. These are only used when the dataset was built with
+# starter_pitcher_stats.py; older datasets fall back to CORE_FEATURE_PLAN.
+STARTER_DERIVED_FEATURES = {
+    'sp_FIP_diff': 'sp_FIP_home - sp_FIP_away',
+    'sp_xFIP_diff': 'sp_xFIP_home - sp_xFIP_away',
+    'sp_K_BB_Pct_diff': 'sp_K_BB_Pct_home - sp_K_BB_Pct_away',
+    'matchup_woba_sp_fip_home': 'off_wOBA_home - sp_FIP_away',
+    'matchup_woba_sp_fip_away': 'off_wOBA_away - sp_FIP_home',
+}
+
+# Names available to every expression that are not features themselves.
+EXPRESSION_GLOBALS = {'__builtins__': {}, 'np': np}
+
+def sanitize_stat_name(stat_name):
+    """Turns a stat like 'K-BB%' into an identifier-safe name like 'K_BB_Pct'."""
+    return stat_name.replace('%', '_Pct').replace('/', '_').replace('-', '_')
+
+def base_feature_columns(include_starters=True):
+    """
+    Maps each base feature name to the merged-dataset column it is read from,
+    e.g. 'off_wOBA_home' -> 'wOBA_home_hitting'. Order follows the dataset layout.
+    """
+    categories = [('hitting', HITTING_STATS), ('pitching', PITCHING_STATS)]
+    if include_starters:
+        categories.append(('starter', STARTER_STATS))
+    columns = {}
+    for category, stats in categories:
+        for team_type in ['home', 'away']:
+            for stat in stats:
+                name = f"{CATEGORY_PREFIXES[category]}{sanitize_stat_name(stat)}_{team_type}"
+                columns[name] = f"{stat}_{team_type}_{category}"
+    return columns
+
+class FeaturePlan:
+    """
+    A compiled feature registry. Dependencies are resolved and expressions are
+    compiled once; `evaluate` then fills a preallocated float32 matrix column by column.
+    """
+
+    def __init__(self, base_columns, derived_features):
+        self.base_columns = dict(base_columns)
+        self.expressions = dict(derived_features)
+
+        overlap = set(self.base_columns) & set(self.expressions)
+        if overlap:
+            raise ValueError(f"Derived features shadow base features: {sorted(overlap)}")
+
+        # Output order: base features in dataset order, then derived features in declared order.
+        self.names = list(self.base_columns) + list(self.expressions)
+        self.index = {name: j for j, name in enumerate(self.names)}
+
+        self.compiled = {}
+        self.dependencies = {}
+        for name, expression in self.expressions.items():
+            tree = ast.parse(expression, mode='eval')
+            deps = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)} - set(EXPRESSION_GLOBALS))
+            unknown = [dep for dep in deps if dep not in self.index]
+            if unknown:
+                raise ValueError(f"Feature '{name}' references unknown features: {unknown}")
+            self.dependencies[name] = deps
+            self.compiled[name] = compile(tree, f"<feature {name}>", 'eval')
+
+        self.eval_order = self._resolve_order()
+        # Identifies the registry itself, so editing any feature invalidates cached outputs.
+        self.signature = json.dumps([self.base_columns, self.expressions], sort_keys=True)
+
+    def _resolve_order(self):
+        """Topologically sorts derived features so every dependency is evaluated first."""
+        order, state = [], {}
+
+        def visit(name, path):
+            if name in self.base_columns or state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Circular feature dependency: {' -> '.join(path + [name])}")
+            state[name] = 'visiting'
+            for dep in self.dependencies[name]:
+                visit(dep, path + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.expressions:
+            visit(name, [])
+        return order
+
+    def evaluate(self, df, cache_dir=None):
+        """
+        Builds the feature matrix for a merged game dataset in a single pass.
+
+        Args:
+            df (pd.DataFrame): Merged game data containing every base column.
+            cache_dir (str): Optional directory for caching derived features. The whole derived
+                             block is stored as one file keyed by a hash of the registry and the
+                             base columns, so an unchanged dataset is loaded instead of recomputed.
+
+        Returns:
+            tuple: (np.ndarray of shape (n_games, n_features) as float32, list of feature names)
+        """
+        missing = [col for col in self.base_columns.values() if col not in df.columns]
+        if missing:
+            raise KeyError(f"Missing base columns: {missing}")
+
+        # Column-major so each feature column is one contiguous block. Base features come
+        # first, so X[:, :n_base] is itself contiguous and can be hashed in one call.
+        X = np.empty((len(df), len(self.names)), dtype=np.float32, order='F')
+        n_base = len(self.base_columns)
+        for name, col in self.base_columns.items():
+            X[:, self.index[name]] = df[col].to_numpy(dtype=np.float32)
+
+        cache_path = None
+        if cache_dir:
+            digest = hashlib.sha1(self.signature.encode() + X[:, :n_base].tobytes()).hexdigest()
+            cache_path = os.path.join(cache_dir, f"{digest}.npy")
+            cached = _load_cached_block(cache_path, (len(df), len(self.names) - n_base))
+            if cached is not None:
+                X[:, n_base:] = cached
+                print("   Loaded derived features from cache.")
+                return X, list(self.names)
+
+        for name in self.eval_order:
+            namespace = {dep: X[:, self.index[dep]] for dep in self.dependencies[name]}
+            X[:, self.index[name]] = eval(self.compiled[name], EXPRESSION_GLOBALS, namespace)
+
+        if cache_path:
+            _save_cached_block(cache_path, X[:, n_base:])
+        return X, list(self.names)
+
+def _load_cached_block(path, shape):
+    """Loads a cached derived-feature block. Unreadable or mismatched files count as a miss."""
+    try:
+        block = np.load(path)
+    except (OSError, ValueError, EOFError):
+        return None
+    if block.shape != shape:
+        return None
+    os.utime(path) # Mark as recently used for pruning
+    return block
+
+def _save_cached_block(path, block):
+    """Writes a block atomically, then prunes the cache down to FEATURE_CACHE_MAX_ENTRIES files."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, block)
+    os.replace(tmp_path, path)
+
+    entries = sorted(
+        (os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.npy')),
+        key=os.path.getmtime, reverse=True
+    )
+    for stale in entries[FEATURE_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+
+# Compiled once at import; shared by training and prediction.
+FEATURE_PLAN = FeaturePlan(base_feature_columns(), {**DERIVED_FEATURES, **STARTER_DERIVED_FEATURES})
+CORE_FEATURE_PLAN = FeaturePlan(base_feature_columns(include_starters=False), DERIVED_FEATURES)
+
+def matrix_fingerprint(X):
+    """A short hash of a feature matrix that ignores row order, e.g. to tie tuned parameters to their data."""
+    rows = np.ascontiguousarray(X)
+    return hashlib.sha1(rows[np.lexsort(rows.T[::-1])].tobytes()).hexdigest()[:12]
+
+def build_feature_matrix(df, cache_dir=None):
+    """
+    Evaluates the registered features for a merged game dataset. See FeaturePlan.evaluate.
+
+    Caching is off by default: hashing the base columns costs more than recomputing the
+    current subtraction features. Pass cache_dir=FEATURE_CACHE_DIR once expensive
+    expressions are registered.
+
+    Datasets built before starter stats existed have no '*_starter' columns; they are
+    evaluated with CORE_FEATURE_PLAN instead, so check the returned names match between
+    the training and prediction matrices.
+    """
+    starter_columns = [col for col in FEATURE_PLAN.base_columns.values() if col.endswith('_starter')]
+    if not all(col in df.columns for col in starter_columns):
+        print("⚠️  Warning: Dataset has no probable-starter columns. Rebuild it with create_modeling_data.py "
+              "to use starter features; continuing without them.")
+        return CORE_FEATURE_PLAN.evaluate(df, cache_dir=cache_dir)
+    return FEATURE_PLAN.evaluate(df, cache_dir=cache_dir)
@@ -3,10 +3,31 @@ import xgboost as xgb
 from sklearn.preprocessing import StandardScaler
 from sklearn.calibration import CalibratedClassifierCV
 from datetime import datetime
-import re
 import sys
+import os
+import json
 import matplotlib.pyplot as plt
 import numpy as np # Imported for odds calculations
+from features import build_feature_matrix, matrix_fingerprint
+
+# Used unless tune_model.py has written tuned parameters.
+DEFAULT_XGB_PARAMS = {'n_estimators': 500, 'learning_rate': 0.05, 'max_depth': 4}
+BEST_PARAMS_PATH = os.path.join('modeling_data', 'tuning', 'best_params.json')
+
+def load_xgb_params(features, X, path=BEST_PARAMS_PATH):
+    """
+    Returns tuned XGBoost parameters from tune_model.py if they were tuned on this exact
+    feature set and training matrix, else DEFAULT_XGB_PARAMS.
+    """
+    if not os.path.exists(path):
+        return dict(DEFAULT_XGB_PARAMS)
+    with open(path) as f:
+        tuned = json.load(f)
+    if tuned.get('feature_names') != features or tuned.get('data_hash') != matrix_fingerprint(X):
+        print(f"⚠️  Warning: '{path}' was tuned on different features or data. Using default parameters; rerun tune_model.py.")
+        return dict(DEFAULT_XGB_PARAMS)
+    print(f"Using tuned parameters from '{path}'.")
+    return tuned['params']
 
 # --- Helper Functions for Betting Calculations ---
 
@@ -26,25 +47,9 @@ def calculate_implied_probability(american_odds):
 
 def rename_columns_for_modeling(df):
     """
-    Parses column names like 'wOBA_home_hitting' and renames them to 'off_wOBA_home'.
-    This version uses a corrected regular expression to handle the STAT_TEAM_CATEGORY format
-    and sanitizes special characters from stat names.
+    Renames the identifier columns used for reporting. Stat columns are read
+    directly by the feature registry in features.py and are left untouched.
     """
-    # Regex to capture: (1: Stat Name)_(2: Team Type)_(3: Category)
-    pattern = re.compile(r"(.+)_(home|away)_(hitting|pitching)$")
-    category_map = {'hitting': 'off_', 'pitching': 'pch_'}
-    
-    new_cols = {}
-    for col in df.columns:
-        match = pattern.match(col)
-        if match:
-            stat_name, team_type, category = match.groups()
-            sanitized_stat = stat_name.replace('%', '_Pct').replace('/', '_').replace('-', '_')
-            new_prefix = category_map[category]
-            new_col_name = f"{new_prefix}{sanitized_stat}_{team_type}"
-            new_cols[col] = new_col_name
-
-    df.rename(columns=new_cols, inplace=True)
     df.rename(columns={
         'home_team': 'HomeTeam',
         'away_team': 'AwayTeam',
@@ -52,23 +57,6 @@ def rename_columns_for_modeling(df):
     }, inplace=True)
     return df
 
-def create_features(df):
-    """Applies feature engineering using the new, sanitized column names."""
-    try:
-        df['off_wOBA_diff'] = df['off_wOBA_home'] - df['off_wOBA_away']
-        df['off_K_Pct_diff'] = df['off_K_Pct_home'] - df['off_K_Pct_away']
-        df['off_BB_Pct_diff'] = df['off_BB_Pct_home'] - df['off_BB_Pct_away']
-        df['off_Barrel_Pct_diff'] = df['off_Barrel_Pct_home'] - df['off_Barrel_Pct_away']
-        df['pch_FIP_diff'] = df['pch_FIP_home'] - df['pch_FIP_away']
-        df['pch_K_BB_Pct_diff'] = df['pch_K_BB_Pct_home'] - df['pch_K_BB_Pct_away']
-        df['pch_Barrel_Pct_diff'] = df['pch_Barrel_Pct_home'] - df['pch_Barrel_Pct_away']
-        df['matchup_woba_fip_home'] = df['off_wOBA_home'] - df['pch_FIP_away']
-        df['matchup_woba_fip_away'] = df['off_wOBA_away'] - df['pch_FIP_home']
-    except KeyError as e:
-        print(f"--- FATAL ERROR during feature creation: A required column is missing: {e} ---")
-        sys.exit(1)
-    return df
-
 def generate_betting_card(predictions_df, kelly_fraction=0.25):
     """
     Analyzes model predictions against betting odds to find value bets.
@@ -146,16 +134,21 @@ if __name__ == "__main__":
         print(f"\nNo games found in the testing dataset. Exiting.")
         sys.exit(0)
 
-    # --- 2. Rename, Feature Engineer & Define Features ---
+    # --- 2. Rename & Build Feature Matrices ---
     train_df = rename_columns_for_modeling(train_df)
     predict_df = rename_columns_for_modeling(predict_df)
-    train_df = create_features(train_df)
-    predict_df = create_features(predict_df)
-    
-    features = [col for col in train_df.columns if col.startswith(('off_', 'pch_', 'matchup_'))]
-    X_train = train_df[features]
+
+    # Training and prediction share one compiled feature registry (see features.py).
+    try:
+        X_train, features = build_feature_matrix(train_df)
+        X_predict, predict_features = build_feature_matrix(predict_df)
+    except KeyError as e:
+        print(f"--- FATAL ERROR during feature creation: A required column is missing: {e} ---")
+        sys.exit(1)
+    if predict_features != features:
+        print("--- FATAL ERROR: Training and testing datasets produce different features. Rebuild both with create_modeling_data.py. ---")
+        sys.exit(1)
     y_train = train_df['HomeTeamWon']
-    X_predict = predict_df[features]
 
     # --- 3. Feature Scaling ---
     scaler = StandardScaler()
@@ -168,10 +161,8 @@ if __name__ == "__main__":
         objective='binary:logistic',
         eval_metric='logloss',
         use_label_encoder=False,
-        n_estimators=500,
-        learning_rate=0.05,
-        max_depth=4,
-        random_state=42
+        random_state=42,
+        **load_xgb_params(features, X_train)
     )
     calibrated_model = CalibratedClassifierCV(base_model, method='isotonic', cv=5) # Using 5-fold CV
     calibrated_model.fit(X_train_scaled, y_train)
@@ -0,0 +1,218 @@
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.model_selection import TimeSeriesSplit
+
+from features import build_feature_matrix, matrix_fingerprint
+
+# --- Configuration ---
+TRAINING_DATA_PATH = os.path.join('modeling_data', 'training_dataset.csv')
+TUNING_DIR = os.path.join('modeling_data', 'tuning')
+TRIALS_PATH = os.path.join(TUNING_DIR, 'trials.jsonl')
+BEST_PARAMS_PATH = os.path.join(TUNING_DIR, 'best_params.json')
+
+# Search space: (kind, low, high). 'log' samples uniformly in log space.
+SEARCH_SPACE = {
+    'learning_rate': ('log', 0.01, 0.3),
+    'max_depth': ('int', 2, 8),
+    'min_child_weight': ('log', 1.0, 20.0),
+    'subsample': ('float', 0.5, 1.0),
+    'colsample_bytree': ('float', 0.5, 1.0),
+    'reg_lambda': ('log', 0.1, 10.0),
+    'gamma': ('float', 0.0, 5.0),
+}
+EARLY_STOPPING_ROUNDS = 30
+
+def sample_configs(n_configs, seed):
+    """Draws `n_configs` parameter sets. The same seed always yields the same configs, which makes resuming possible."""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(n_configs):
+        config = {}
+        for name, (kind, low, high) in SEARCH_SPACE.items():
+            if kind == 'int':
+                config[name] = rng.randint(low, high)
+            elif kind == 'log':
+                config[name] = round(math.exp(rng.uniform(math.log(low), math.log(high))), 5)
+            else:
+                config[name] = round(rng.uniform(low, high), 5)
+        configs.append(config)
+    return configs
+
+def config_key(config):
+    """A stable short hash identifying a parameter set."""
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+
+def load_trials(path, data_hash):
+    """Reads previously completed trials for this dataset, keyed by (config key, tree budget)."""
+    completed = {}
+    if not os.path.exists(path):
+        return completed
+    with open(path) as f:
+        for line in f:
+            try:
+                trial = json.loads(line)
+            except json.JSONDecodeError:
+                continue # A partially written last line from an interrupted run
+            if trial.get('data_hash') == data_hash:
+                completed[(trial['config_key'], trial['budget'])] = trial
+    return completed
+
+# --- Worker Process ---
+# Each worker receives the feature matrix once via the pool initializer instead of once per trial.
+_WORKER_DATA = {}
+
+def _init_worker(X, y, folds, n_threads):
+    _WORKER_DATA.update(X=X, y=y, folds=folds, n_threads=n_threads)
+
+def evaluate_config(config, budget):
+    """
+    Fits one config with up to `budget` trees on every time-ordered fold, stopping each
+    fit early once validation log loss stops improving.
+
+    Returns:
+        dict: Mean validation log loss and the best iteration found on each fold.
+    """
+    X, y, folds = _WORKER_DATA['X'], _WORKER_DATA['y'], _WORKER_DATA['folds']
+    start = time.perf_counter()
+    scores, best_iterations = [], []
+    for train_idx, valid_idx in folds:
+        model = xgb.XGBClassifier(
+            objective='binary:logistic',
+            eval_metric='logloss',
+            n_estimators=budget,
+            early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+            n_jobs=_WORKER_DATA['n_threads'],
+            random_state=42,
+            **config
+        )
+        model.fit(X[train_idx], y[train_idx], eval_set=[(X[valid_idx], y[valid_idx])], verbose=False)
+        scores.append(float(model.best_score))
+        best_iterations.append(int(model.best_iteration))
+    return {
+        'logloss': float(np.mean(scores)),
+        'fold_logloss': scores,
+        'best_iterations': best_iterations,
+        'seconds': round(time.perf_counter() - start, 2),
+    }
+
+# --- Search ---
+def successive_halving(X, y, n_configs=27, eta=3, min_trees=50, max_trees=1000, n_splits=5,
+                       workers=4, max_threads=None, seed=42, trials_path=TRIALS_PATH):
+    """
+    Runs a successive-halving search over SEARCH_SPACE.
+
+    Every rung evaluates the surviving configs with `eta` times more trees than the last,
+    starting at `min_trees`, and keeps the best 1/eta of them. Trials are appended to
+    `trials_path` as they finish, so an interrupted search picks up where it left off.
+
+    Args:
+        X (np.ndarray): Feature matrix in chronological order.
+        y (np.ndarray): Binary labels aligned with X.
+        workers (int): Number of trial processes.
+        max_threads (int): Cap on total threads across all processes. Defaults to the CPU count.
+
+    Returns:
+        tuple: (best config, its final-rung trial record)
+    """
+    max_threads = max_threads or os.cpu_count() or 1
+    workers = max(1, min(workers, max_threads))
+    threads_per_trial = max(1, max_threads // workers)
+    folds = list(TimeSeriesSplit(n_splits=n_splits).split(X))
+
+    data_hash = hashlib.sha1(X.tobytes() + y.tobytes() + str(n_splits).encode()).hexdigest()[:12]
+    completed = load_trials(trials_path, data_hash)
+    os.makedirs(os.path.dirname(trials_path) or '.', exist_ok=True)
+
+    survivors = sample_configs(n_configs, seed)
+    budget = min_trees
+    print(f"Searching {n_configs} configs on {len(X)} games with {workers} process(es) x {threads_per_trial} thread(s).")
+    if completed:
+        print(f"   Resuming: {len(completed)} trial(s) already on disk.")
+
+    with open(trials_path, 'a') as trials_file, concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(X, y, folds, threads_per_trial)
+    ) as executor:
+        while True:
+            pending = {}
+            for config in survivors:
+                key = (config_key(config), budget)
+                if key not in completed:
+                    pending[executor.submit(evaluate_config, config, budget)] = (config, key)
+
+            for future in concurrent.futures.as_completed(pending):
+                config, key = pending[future]
+                trial = {'config_key': key[0], 'budget': budget, 'data_hash': data_hash, 'params': config, **future.result()}
+                completed[key] = trial
+                trials_file.write(json.dumps(trial) + '\n')
+                trials_file.flush()
+
+            ranked = sorted(survivors, key=lambda c: completed[(config_key(c), budget)]['logloss'])
+            best = completed[(config_key(ranked[0]), budget)]
+            print(f"   Rung {budget:>5} trees: {len(survivors):>3} config(s), best logloss {best['logloss']:.4f}")
+
+            if len(ranked) == 1 or budget >= max_trees:
+                return ranked[0], best
+            survivors = ranked[:max(1, len(ranked) // eta)]
+            budget = min(budget * eta, max_trees)
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune the XGBoost model with successive halving and time-ordered CV.")
+    parser.add_argument('--configs', type=int, default=27, help="Number of configs in the first rung.")
+    parser.add_argument('--eta', type=int, default=3, help="Keep 1/eta of configs per rung and grow trees by eta.")
+    parser.add_argument('--min-trees', type=int, default=50)
+    parser.add_argument('--max-trees', type=int, default=1000)
+    parser.add_argument('--splits', type=int, default=5, help="Number of time-ordered CV folds.")
+    parser.add_argument('--workers', type=int, default=4, help="Number of trial processes.")
+    parser.add_argument('--max-threads', type=int, default=None, help="Total thread cap across all processes.")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    try:
+        train_df = pd.read_csv(TRAINING_DATA_PATH)
+    except FileNotFoundError as e:
+        print(f"ERROR: Could not find data files. {e}")
+        sys.exit(1)
+    train_df.columns = train_df.columns.str.strip()
+
+    # Time-ordered folds only make sense on chronologically sorted games.
+    train_df = train_df.sort_values(['game_date', 'game_id'], kind='stable').reset_index(drop=True)
+    try:
+        X, features = build_feature_matrix(train_df)
+    except KeyError as e:
+        print(f"--- FATAL ERROR during feature creation: A required column is missing: {e} ---")
+        sys.exit(1)
+    y = train_df['home_team_won'].to_numpy(dtype=np.int32)
+
+    best_config, best_trial = successive_halving(
+        X, y, n_configs=args.configs, eta=args.eta, min_trees=args.min_trees, max_trees=args.max_trees,
+        n_splits=args.splits, workers=args.workers, max_threads=args.max_threads, seed=args.seed
+    )
+
+    # Fix the tree count for full-data training at the average early-stopped length.
+    best_params = dict(best_config, n_estimators=int(np.mean(best_trial['best_iterations'])) + 1)
+    with open(BEST_PARAMS_PATH, 'w') as f:
+        json.dump({
+            'params': best_params,
+            'logloss': best_trial['logloss'],
+            'config_key': best_trial['config_key'],
+            # Lets train_model.py ignore these params once the features or data change.
+            'data_hash': matrix_fingerprint(X),
+            'feature_names': features,
+        }, f, indent=2)
+
+    print("\n✅ Tuning complete.")
+    print(f"   Best time-ordered CV logloss: {best_trial['logloss']:.4f}")
+    print(f"   Params: {best_params}")
+    print(f"   Saved to '{BEST_PARAMS_PATH}' (used by train_model.py)")